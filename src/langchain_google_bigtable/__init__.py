@@ -13,32 +13,76 @@
 # limitations under the License.
 
 
-from .async_key_value_store import AsyncBigtableByteStore
-from .async_vector_store import (
-    AsyncBigtableVectorStore,
-    ColumnConfig,
-    DistanceStrategy,
-    QueryParameters,
-    VectorDataType,
-    VectorMetadataMapping,
-)
-from .chat_message_history import (
-    BigtableChatMessageHistory,
-    create_chat_history_table,
-    init_chat_history_table,
-)
-from .engine import BigtableEngine
-from .key_value_store import BigtableByteStore, init_key_value_store_table
-from .loader import (
-    BigtableLoader,
-    BigtableSaver,
-    Encoding,
-    MetadataMapping,
-    init_document_table,
-)
-from .vector_store import BigtableVectorStore, init_vector_store_table
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .version import __version__
 
+if TYPE_CHECKING:
+    from .async_key_value_store import AsyncBigtableByteStore
+    from .async_vector_store import (
+        AsyncBigtableVectorStore,
+        ColumnConfig,
+        DistanceStrategy,
+        QueryParameters,
+        VectorDataType,
+        VectorMetadataMapping,
+    )
+    from .chat_message_history import (
+        BigtableChatMessageHistory,
+        create_chat_history_table,
+        init_chat_history_table,
+    )
+    from .engine import BigtableEngine
+    from .key_value_store import BigtableByteStore, init_key_value_store_table
+    from .loader import (
+        BigtableLoader,
+        BigtableSaver,
+        Encoding,
+        MetadataMapping,
+        init_document_table,
+    )
+    from .vector_store import BigtableVectorStore, init_vector_store_table
+
+# Public names and the submodule defining them. Submodules are only imported
+# the first time one of their names is accessed (PEP 562).
+_LAZY_IMPORTS = {
+    "AsyncBigtableByteStore": ".async_key_value_store",
+    "AsyncBigtableVectorStore": ".async_vector_store",
+    "ColumnConfig": ".async_vector_store",
+    "DistanceStrategy": ".async_vector_store",
+    "QueryParameters": ".async_vector_store",
+    "VectorDataType": ".async_vector_store",
+    "VectorMetadataMapping": ".async_vector_store",
+    "BigtableChatMessageHistory": ".chat_message_history",
+    "create_chat_history_table": ".chat_message_history",
+    "init_chat_history_table": ".chat_message_history",
+    "BigtableEngine": ".engine",
+    "BigtableByteStore": ".key_value_store",
+    "init_key_value_store_table": ".key_value_store",
+    "BigtableLoader": ".loader",
+    "BigtableSaver": ".loader",
+    "Encoding": ".loader",
+    "MetadataMapping": ".loader",
+    "init_document_table": ".loader",
+    "BigtableVectorStore": ".vector_store",
+    "init_vector_store_table": ".vector_store",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
+
 __all__ = [
     "BigtableChatMessageHistory",
     "create_chat_history_table",
@@ -13,10 +13,15 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
+    Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -29,13 +34,37 @@ from typing import (
 from google.cloud import bigtable
 from google.cloud.bigtable.data import (
     DeleteAllFromRow,
+    FailedMutationEntryError,
+    Mutation,
+    MutationsExceptionGroup,
     ReadRowsQuery,
     RowMutationEntry,
     RowRange,
+    SetCell,
     TableAsync,
 )
 from langchain_core.stores import BaseStore
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# DeleteAllFromRow carries no state, so one instance is shared by every entry.
+_DELETE_ALL_FROM_ROW = DeleteAllFromRow()
+
+
+def _prefix_end_key(prefix: bytes) -> Optional[bytes]:
+    """
+    Returns the smallest row key that sorts after every key starting with `prefix`.
+
+    Trailing 0xFF bytes cannot be incremented, so they are dropped before the
+    last remaining byte is incremented. A prefix made only of 0xFF bytes has no
+    such key, in which case `None` is returned to leave the range unbounded.
+    """
+    stripped = prefix.rstrip(b"\xff")
+    if not stripped:
+        return None
+    return stripped[:-1] + bytes([stripped[-1] + 1])
+
 
 class AsyncBigtableByteStore(BaseStore[str, bytes]):
     """
@@ -53,12 +82,21 @@ class AsyncBigtableByteStore(BaseStore[str, bytes]):
 
     DEFAULT_COLUMN_FAMILY = "kv"
     DEFAULT_COLUMN_QUALIFIER = "val".encode("utf-8")
+    DEFAULT_READ_SHARDS = 8
+    # amget only splits a read once every shard would get at least this many keys
+    MIN_KEYS_PER_READ_SHARD = 500
+    # amset/amdelete send at most this many rows per `bulk_mutate_rows` request
+    MAX_ENTRIES_PER_MUTATE_REQUEST = 1000
+    MAX_CONCURRENT_MUTATE_REQUESTS = 10
 
     def __init__(
         self,
         async_table: TableAsync,
         column_family: str = DEFAULT_COLUMN_FAMILY,
         column_qualifier: bytes = DEFAULT_COLUMN_QUALIFIER,
+        read_shards: int = DEFAULT_READ_SHARDS,
+        negative_cache_size: int = 0,
+        read_cache_max_bytes: int = 0,
     ):
         """
         Initializes a new AsyncBigtableByteStore.
@@ -67,10 +105,57 @@ class AsyncBigtableByteStore(BaseStore[str, bytes]):
             async_table: The `TableAsync` instance to use for Bigtable operations.
             column_family: The column family to store values in.
             column_qualifier: The column qualifier to store values in.
+            read_shards: The maximum number of concurrent `read_rows` requests a
+              single large `amget` call is split into. Use 1 to disable sharding.
+            negative_cache_size: The number of keys recently found missing by
+              `amget` to remember, so later reads of them skip Bigtable. Only
+              writes made through this instance invalidate the cache, so enable it
+              only if it is the sole writer or briefly stale misses are acceptable.
+              Defaults to 0, which disables the cache.
+            read_cache_max_bytes: The total size, in bytes of keys and values, of
+              an in-process LRU cache of values read by `amget`. Cached keys are
+              answered without reading Bigtable. The same caveat as for
+              `negative_cache_size` applies. Defaults to 0, which disables the
+              cache.
+
+        Raises:
+            ValueError: If `read_shards` is less than 1, or `negative_cache_size`
+              or `read_cache_max_bytes` is negative.
         """
+        if read_shards < 1:
+            raise ValueError("read_shards must be at least 1.")
+        if negative_cache_size < 0:
+            raise ValueError("negative_cache_size must not be negative.")
+        if read_cache_max_bytes < 0:
+            raise ValueError("read_cache_max_bytes must not be negative.")
         self._table = async_table
+        self._read_shards = read_shards
+        self._negative_cache_size = negative_cache_size
+        self._negative_cache: OrderedDict[bytes, None] = OrderedDict()
+        self._read_cache_max_bytes = read_cache_max_bytes
+        self._read_cache: OrderedDict[bytes, bytes] = OrderedDict()
+        self._read_cache_bytes = 0
+        # Bumped by every write so reads that overlap a write don't cache results.
+        self._write_generation = 0
         self._column_family = column_family
-        self._column_qualifier = column_qualifier
+        # Encoded once here so the hot paths never re-encode the qualifier.
+        self._column_qualifier = (
+            column_qualifier.encode("utf-8")
+            if isinstance(column_qualifier, str)
+            else column_qualifier
+        )
+        # Only the most recent cell of the value column is ever read, so every
+        # row returned by amget holds exactly that one cell.
+        self._read_filter = bigtable.data.row_filters.RowFilterChain(
+            filters=[
+                bigtable.data.row_filters.ColumnRangeFilter(
+                    self._column_family,
+                    start_qualifier=self._column_qualifier,
+                    end_qualifier=self._column_qualifier,
+                ),
+                bigtable.data.row_filters.CellsColumnLimitFilter(1),
+            ]
+        )
 
     @property
     def table(self):
@@ -100,31 +185,255 @@ class AsyncBigtableByteStore(BaseStore[str, bytes]):
             A list of byte values corresponding to the input keys. If a key is not
             found, `None` is returned for that key's position in the list.
         """
-        row_keys = [key.encode() for key in keys]
-        results = {}
-        row_filter = bigtable.data.row_filters.CellsColumnLimitFilter(1)
+        row_keys = list(map(str.encode, keys))
+        if not row_keys:
+            # A query without row keys would scan the whole table
+            return []
+        if len(row_keys) == 1:
+            return [await self._get_one(row_keys[0])]
+
+        values: Dict[bytes, bytes] = {}
+        await self._fetch_values(row_keys, values.__setitem__)
+        return list(map(values.get, row_keys))
+
+    async def amget_numpy(self, keys: Sequence[str]) -> np.ndarray:
+        """
+        Asynchronously retrieves values for a sequence of keys as a NumPy array.
 
-        query = bigtable.data.ReadRowsQuery(
-            row_keys=cast(List[Union[str, bytes]], row_keys), row_filter=row_filter
-        )
+        This is the same as `amget`, but the values are written straight into a
+        preallocated one-dimensional NumPy array of `object` dtype as they are
+        read, without building a result list first.
+
+        Args:
+            keys: A sequence of keys to retrieve values for.
+
+        Returns:
+            An array of byte values corresponding to the input keys. If a key is
+            not found, `None` is stored at that key's position in the array.
+        """
+        import numpy as np
+
+        row_keys = list(map(str.encode, keys))
+        # Object arrays created by np.empty are filled with None
+        array = np.empty(len(row_keys), dtype=object)
+        if not row_keys:
+            return array
+        if len(row_keys) == 1:
+            array[0] = await self._get_one(row_keys[0])
+            return array
+
+        positions: Dict[bytes, List[int]] = {}
+        for position, row_key in enumerate(row_keys):
+            positions.setdefault(row_key, []).append(position)
+
+        def _store(row_key: bytes, value: bytes) -> None:
+            for position in positions[row_key]:
+                array[position] = value
+
+        await self._fetch_values(row_keys, _store)
+        return array
+
+    async def _fetch_values(
+        self, row_keys: List[bytes], on_value: Callable[[bytes, bytes], None]
+    ) -> None:
+        """
+        Retrieves the values of several keys, using the caches where possible.
+
+        Cached values are reported first, the remaining keys are streamed from
+        Bigtable, and the caches are updated with what was read.
+
+        Args:
+            row_keys: The encoded keys to retrieve values for.
+            on_value: Called with the key and value of every key that is found,
+              once per distinct key.
+        """
+        read_cache = self._read_cache
+        negative_cache = self._negative_cache
+        if read_cache or negative_cache:
+            fetch_keys = []
+            for key in row_keys:
+                cached = read_cache.get(key)
+                if cached is not None:
+                    on_value(key, cached)
+                    read_cache.move_to_end(key)
+                elif key not in negative_cache:
+                    fetch_keys.append(key)
+            if not fetch_keys:
+                return
+        else:
+            fetch_keys = row_keys
+        write_generation = self._write_generation
+
+        caching = bool(self._negative_cache_size or self._read_cache_max_bytes)
+        fetched: Dict[bytes, bytes] = {}
+        on_read: Callable[[bytes, bytes], None]
+        if caching:
+
+            def _record(row_key: bytes, value: bytes) -> None:
+                fetched[row_key] = value
+                on_value(row_key, value)
+
+            on_read = _record
+        else:
+            on_read = on_value
 
         # It only reads the most recent version for each row
-        rows_read = await self.table.read_rows(query)
-        for row in rows_read:
-            cell = row.get_cells(
-                family=self.value_column_family, qualifier=self.value_column_qualifier
-            )[0]
-            if cell:
-                results[row.row_key] = cell.value
-
-        res = []
-        for key in keys:
-            if key.encode() in results:
-                res.append(results[key.encode()])
-            else:
-                res.append(None)
-
-        return res
+        queries = self._read_queries(fetch_keys, self._read_filter)
+        if len(queries) == 1:
+            await self._read_values(queries[0], on_read)
+        else:
+            await asyncio.gather(
+                *(self._read_values(query, on_read) for query in queries)
+            )
+
+        if caching and write_generation == self._write_generation:
+            if self._negative_cache_size:
+                self._remember_missing(key for key in fetch_keys if key not in fetched)
+            if self._read_cache_max_bytes:
+                self._remember_values(fetched.items())
+
+    async def _get_one(self, row_key: bytes) -> Optional[bytes]:
+        """
+        Retrieves the value of a single key.
+
+        This is the fast path of `amget` for one key, which reads the row with
+        `read_row` and skips building the batch queries and result mapping.
+
+        Args:
+            row_key: The encoded key to retrieve the value for.
+
+        Returns:
+            The value of the key, or `None` if it is not found.
+        """
+        cached = self._read_cache.get(row_key)
+        if cached is not None:
+            self._read_cache.move_to_end(row_key)
+            return cached
+        if row_key in self._negative_cache:
+            return None
+        write_generation = self._write_generation
+
+        row = await self.table.read_row(row_key, row_filter=self._read_filter)
+        value = row.cells[0].value if row and row.cells else None
+
+        if write_generation == self._write_generation:
+            if value is None:
+                if self._negative_cache_size:
+                    self._remember_missing((row_key,))
+            elif self._read_cache_max_bytes:
+                self._remember_values(((row_key, value),))
+        return value
+
+    def _remember_missing(self, row_keys: Iterable[bytes]) -> None:
+        """
+        Adds keys that were not found to the negative cache.
+
+        The cache is bounded by `negative_cache_size`; the keys that were added
+        longest ago are evicted first.
+
+        Args:
+            row_keys: The encoded keys that were not found.
+        """
+        negative_cache = self._negative_cache
+        for row_key in row_keys:
+            negative_cache[row_key] = None
+            negative_cache.move_to_end(row_key)
+        while len(negative_cache) > self._negative_cache_size:
+            negative_cache.popitem(last=False)
+
+    def _remember_values(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        """
+        Adds values that were read to the read cache.
+
+        The cache is bounded by `read_cache_max_bytes`; the least recently used
+        entries are evicted first. Entries larger than the whole cache are skipped.
+
+        Args:
+            items: The (encoded key, value) pairs that were read.
+        """
+        read_cache = self._read_cache
+        max_bytes = self._read_cache_max_bytes
+        for row_key, value in items:
+            size = len(row_key) + len(value)
+            if size > max_bytes:
+                continue
+            previous = read_cache.pop(row_key, None)
+            if previous is not None:
+                self._read_cache_bytes -= len(row_key) + len(previous)
+            read_cache[row_key] = value
+            self._read_cache_bytes += size
+        while self._read_cache_bytes > max_bytes:
+            row_key, value = read_cache.popitem(last=False)
+            self._read_cache_bytes -= len(row_key) + len(value)
+
+    def _invalidate(self, row_keys: Iterable[bytes]) -> None:
+        """
+        Drops cached state for keys that were written or deleted.
+
+        Args:
+            row_keys: The encoded keys that were written or deleted.
+        """
+        self._write_generation += 1
+        read_cache = self._read_cache
+        negative_cache = self._negative_cache
+        if read_cache or negative_cache:
+            for row_key in row_keys:
+                negative_cache.pop(row_key, None)
+                value = read_cache.pop(row_key, None)
+                if value is not None:
+                    self._read_cache_bytes -= len(row_key) + len(value)
+
+    def _read_queries(
+        self, row_keys: List[bytes], row_filter: bigtable.data.row_filters.RowFilter
+    ) -> List[ReadRowsQuery]:
+        """
+        Builds the queries for reading the given rows, sharding large requests.
+
+        Bigtable serves the keys of a single `ReadRows` request one after the
+        other in lexicographic order, so the keys are de-duplicated and sorted
+        before they are sent. A large batch is then cut into contiguous ranges
+        of keys that are read in parallel, each keeping the locality of its keys.
+
+        Args:
+            row_keys: The encoded row keys to read.
+            row_filter: The filter to apply to every request.
+
+        Returns:
+            The queries to run, covering every requested key.
+        """
+        unique_keys = sorted(set(row_keys))
+        num_shards = min(
+            self._read_shards, len(unique_keys) // self.MIN_KEYS_PER_READ_SHARD
+        )
+        shard_size = -(-len(unique_keys) // max(num_shards, 1))
+        return [
+            ReadRowsQuery(
+                row_keys=cast(List[Union[str, bytes]], unique_keys[i : i + shard_size]),
+                row_filter=row_filter,
+            )
+            for i in range(0, len(unique_keys), shard_size)
+        ]
+
+    async def _read_values(
+        self, query: ReadRowsQuery, on_value: Callable[[bytes, bytes], None]
+    ) -> None:
+        """
+        Streams the rows of a query and records the stored value of each row.
+
+        Rows are processed as they arrive instead of being collected first, so
+        only one row of the response is held in memory at a time. The query is
+        expected to use the store's read filter.
+
+        Args:
+            query: The query to run.
+            on_value: Called with the key and value of every row that is read.
+        """
+        # The read filter leaves only the value cell in each row, so the cell can
+        # be taken directly without building the row's family/qualifier index.
+        async for row in await self.table.read_rows_stream(query):
+            cells = row.cells
+            if cells:
+                on_value(row.row_key, cells[0].value)
 
     async def amset(self, key_value_pairs: Sequence[Tuple[str, bytes]]) -> None:
         """
@@ -136,25 +445,24 @@ class AsyncBigtableByteStore(BaseStore[str, bytes]):
         Raises:
             TypeError: If any key is not a string or any value is not bytes.
         """
-        mutations = []
+        mutations: List[RowMutationEntry] = []
+        # Bound once so the loop below does not repeat the attribute lookups
+        append = mutations.append
+        family = self._column_family
+        qualifier = self._column_qualifier
         for key, value in key_value_pairs:
             if not isinstance(key, str):
                 raise TypeError("Keys must be of type 'str'.")
             if not isinstance(value, bytes):
                 raise TypeError("Values must be of type 'bytes'.")
 
-            mutation = bigtable.data.SetCell(
-                family=self.value_column_family,
-                qualifier=self.value_column_qualifier,
-                new_value=value,
-            )
-
-            row_mutation = bigtable.data.RowMutationEntry(
-                row_key=key, mutations=[mutation]
-            )
-            mutations.append(row_mutation)
+            mutation = SetCell(family=family, qualifier=qualifier, new_value=value)
+            append(RowMutationEntry(row_key=key, mutations=[mutation]))
 
-        await self.table.bulk_mutate_rows(mutations)
+        try:
+            await self._bulk_mutate(mutations)
+        finally:
+            self._invalidate(entry.row_key for entry in mutations)
 
     async def amdelete(self, keys: Sequence[str]) -> None:
         """
@@ -163,16 +471,114 @@ class AsyncBigtableByteStore(BaseStore[str, bytes]):
         Args:
             keys: A sequence of keys to delete.
         """
-        mutations = []
-        for key in keys:
-            mutation = DeleteAllFromRow()
-            row_mutation = RowMutationEntry(key, [mutation])
-            mutations.append(row_mutation)
+        mutations = [RowMutationEntry(key, [_DELETE_ALL_FROM_ROW]) for key in keys]
 
         if mutations:
+            try:
+                await self._bulk_mutate(mutations)
+            finally:
+                self._invalidate(entry.row_key for entry in mutations)
+
+    async def amupdate(
+        self,
+        key_value_pairs: Sequence[Tuple[str, bytes]],
+        delete_keys: Sequence[str],
+    ) -> None:
+        """
+        Asynchronously deletes and stores key-value pairs in a single pass.
+
+        This is equivalent to calling `amdelete(delete_keys)` followed by
+        `amset(key_value_pairs)`, but all the mutations are sent together. A key
+        that is both deleted and set gets a single row mutation that clears the
+        row and then writes the new value.
+
+        Args:
+            key_value_pairs: A sequence of (key, value) tuples to store.
+            delete_keys: A sequence of keys to delete.
+
+        Raises:
+            TypeError: If any key is not a string or any value is not bytes.
+        """
+        row_mutations: Dict[str, List[Mutation]] = {
+            key: [_DELETE_ALL_FROM_ROW] for key in delete_keys
+        }
+        family = self._column_family
+        qualifier = self._column_qualifier
+        for key, value in key_value_pairs:
+            if not isinstance(key, str):
+                raise TypeError("Keys must be of type 'str'.")
+            if not isinstance(value, bytes):
+                raise TypeError("Values must be of type 'bytes'.")
+
+            mutation = SetCell(family=family, qualifier=qualifier, new_value=value)
+            row_mutations.setdefault(key, []).append(mutation)
+
+        if not row_mutations:
+            return
+
+        mutations = [
+            RowMutationEntry(row_key=key, mutations=row_mutation)
+            for key, row_mutation in row_mutations.items()
+        ]
+        try:
+            await self._bulk_mutate(mutations)
+        finally:
+            self._invalidate(entry.row_key for entry in mutations)
+
+    async def _bulk_mutate(self, mutations: List[RowMutationEntry]) -> None:
+        """
+        Applies row mutations in batches with a bounded number of in-flight requests.
+
+        Small inputs are sent as a single `bulk_mutate_rows` request. Larger inputs
+        are split into batches of `MAX_ENTRIES_PER_MUTATE_REQUEST` entries, with at
+        most `MAX_CONCURRENT_MUTATE_REQUESTS` batches in flight at a time. Every
+        batch is attempted before any error is raised.
+
+        Args:
+            mutations: The row mutations to apply.
+
+        Raises:
+            MutationsExceptionGroup: If any entry failed. The failures of all
+              batches are combined, and each `FailedMutationEntryError.index` is
+              the position of the failed entry in `mutations`. Any other error
+              raised by a batch is re-raised as is.
+        """
+        batch_size = self.MAX_ENTRIES_PER_MUTATE_REQUEST
+        if len(mutations) <= batch_size:
             await self.table.bulk_mutate_rows(mutations)
+            return
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_MUTATE_REQUESTS)
 
-    async def ayield_keys(self, *, prefix: Optional[str] = None) -> AsyncIterator[str]:
+        async def _flush(batch: List[RowMutationEntry]) -> None:
+            async with semaphore:
+                await self.table.bulk_mutate_rows(batch)
+
+        offsets = range(0, len(mutations), batch_size)
+        results = await asyncio.gather(
+            *(_flush(mutations[i : i + batch_size]) for i in offsets),
+            return_exceptions=True,
+        )
+
+        failures: List[FailedMutationEntryError] = []
+        for offset, result in zip(offsets, results):
+            if result is None:
+                continue
+            if not isinstance(result, MutationsExceptionGroup):
+                raise result
+            for exc in result.exceptions:
+                if isinstance(exc, FailedMutationEntryError) and exc.index is not None:
+                    # Indices are relative to the batch; report them against the input
+                    exc = FailedMutationEntryError(
+                        exc.index + offset, exc.entry, cast(Exception, exc.__cause__)
+                    )
+                failures.append(cast(FailedMutationEntryError, exc))
+        if failures:
+            raise MutationsExceptionGroup(failures, len(mutations))
+
+    async def ayield_keys(
+        self, *, prefix: Optional[str] = None, prefixes: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[str]:
         """
         Asynchronously yields keys matching a given prefix.
 
@@ -181,25 +587,77 @@ class AsyncBigtableByteStore(BaseStore[str, bytes]):
         Args:
            prefix: An optional prefix to filter keys by. If `None` or an empty
              string, all keys are yielded.
+           prefixes: An optional sequence of prefixes to filter keys by, in
+             addition to `prefix`. Keys matching any of them are yielded from a
+             single scan. An empty sequence without `prefix` matches no keys.
 
         Yields:
             Keys from the table that match a given prefix.
         """
-        row_filter = bigtable.data.row_filters.StripValueTransformerFilter(True)
-        if not prefix or prefix == "":
+        async for row_key in self.ayield_keys_bytes(prefix=prefix, prefixes=prefixes):
+            yield row_key.decode("utf-8")
+
+    async def ayield_keys_bytes(
+        self, *, prefix: Optional[str] = None, prefixes: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Asynchronously yields the raw row keys matching a given prefix.
+
+        This is the same as `ayield_keys`, but the keys are yielded as the
+        UTF-8 encoded bytes stored in Bigtable, which avoids decoding every
+        key for callers that do not need `str` keys.
+
+        Args:
+           prefix: An optional prefix to filter keys by. If `None` or an empty
+             string, all keys are yielded.
+           prefixes: An optional sequence of prefixes to filter keys by, in
+             addition to `prefix`. Keys matching any of them are yielded from a
+             single scan. An empty sequence without `prefix` matches no keys.
+
+        Yields:
+            Encoded keys from the table that match a given prefix.
+        """
+        # Only the row key is needed, so a single cell without its value is
+        # returned for each row.
+        row_filter = bigtable.data.row_filters.RowFilterChain(
+            filters=[
+                bigtable.data.row_filters.CellsRowLimitFilter(1),
+                bigtable.data.row_filters.StripValueTransformerFilter(True),
+            ]
+        )
+        all_prefixes = list(prefixes) if prefixes is not None else []
+        if prefix is not None:
+            all_prefixes.append(prefix)
+        elif prefixes is not None and not all_prefixes:
+            # An explicitly empty set of prefixes matches nothing
+            return
+
+        if not all_prefixes or "" in all_prefixes:
             # Return all keys
             query = ReadRowsQuery(row_filter=row_filter)
-            async for row in await self.table.read_rows_stream(query):
-                yield row.row_key.decode("utf-8")
-
-        else:
+        elif len(all_prefixes) == 1:
             # Return keys matching the prefix
-            end_key = prefix[:-1] + chr(ord(prefix[-1]) + 1)
-            prefix_range = RowRange(start_key=prefix, end_key=end_key)
+            start_key = all_prefixes[0].encode("utf-8")
+            prefix_range = RowRange(
+                start_key=start_key, end_key=_prefix_end_key(start_key)
+            )
             query = ReadRowsQuery(row_ranges=[prefix_range], row_filter=row_filter)
-
-            async for row in await self._table.read_rows_stream(query):
-                yield row.row_key.decode("utf-8")
+        else:
+            # Return keys matching any of the prefixes. Prefixes that extend
+            # another prefix are already covered by its range.
+            prefix_ranges = []
+            last_key: Optional[bytes] = None
+            for start_key in sorted({p.encode("utf-8") for p in all_prefixes}):
+                if last_key is not None and start_key.startswith(last_key):
+                    continue
+                prefix_ranges.append(
+                    RowRange(start_key=start_key, end_key=_prefix_end_key(start_key))
+                )
+                last_key = start_key
+            query = ReadRowsQuery(row_ranges=prefix_ranges, row_filter=row_filter)
+
+        async for row in await self.table.read_rows_stream(query):
+            yield row.row_key
 
     # Sync methods are not implemented in the Async-only version
     def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
@@ -37,6 +37,7 @@ from .engine import BigtableEngine
 
 if TYPE_CHECKING:
     import google.auth.credentials  # type: ignore
+    import numpy as np
 
 DEFAULT_COLUMN_FAMILY = "kv"
 DEFAULT_COLUMN_QUALIFIER = "val".encode("utf-8")
@@ -285,6 +286,48 @@ class BigtableByteStore(BaseStore[str, bytes]):
 
         return await self._engine._run_as_async(_internal())
 
+    async def amget_numpy(self, keys: Sequence[str]) -> np.ndarray:
+        """
+        Asynchronously retrieves values for a sequence of keys as a NumPy array.
+
+        Args:
+            keys: A sequence of keys to retrieve values for.
+
+        Returns:
+            A one-dimensional array of `object` dtype with the byte values
+            corresponding to the input keys. If a key is not found, `None` is
+            stored at that key's position in the array.
+        """
+
+        async def _internal():
+            store = await self._get_async_store()
+            return await store.amget_numpy(keys)
+
+        return await self._engine._run_as_async(_internal())
+
+    async def amget_many(
+        self, batches: Sequence[Sequence[str]]
+    ) -> List[List[Optional[bytes]]]:
+        """
+        Asynchronously retrieves values for several batches of keys at once.
+
+        All batches are read concurrently with a single hop to the engine's
+        background loop, instead of one hop per `amget` call.
+
+        Args:
+            batches: A sequence of key sequences to retrieve values for.
+
+        Returns:
+            A list with one result list per batch, in the order of `batches`. Each
+            result list is the same as `amget` would return for that batch.
+        """
+
+        async def _internal():
+            store = await self._get_async_store()
+            return list(await asyncio.gather(*(store.amget(b) for b in batches)))
+
+        return await self._engine._run_as_async(_internal())
+
     async def amset(self, key_value_pairs: Sequence[Tuple[str, bytes]]) -> None:
         """
         Asynchronously stores key-value pairs in the Bigtable.
@@ -316,7 +359,34 @@ class BigtableByteStore(BaseStore[str, bytes]):
 
         await self._engine._run_as_async(_internal())
 
-    async def ayield_keys(self, *, prefix: Optional[str] = None) -> AsyncIterator[str]:
+    async def amupdate(
+        self,
+        key_value_pairs: Sequence[Tuple[str, bytes]],
+        delete_keys: Sequence[str],
+    ) -> None:
+        """
+        Asynchronously deletes and stores key-value pairs in a single pass.
+
+        This is equivalent to calling `amdelete(delete_keys)` followed by
+        `amset(key_value_pairs)`, but all the mutations are sent together.
+
+        Args:
+            key_value_pairs: A sequence of (key, value) tuples to store.
+            delete_keys: A sequence of keys to delete.
+
+        Raises:
+            TypeError: If any key is not a string or any value is not bytes.
+        """
+
+        async def _internal():
+            store = await self._get_async_store()
+            return await store.amupdate(key_value_pairs, delete_keys)
+
+        await self._engine._run_as_async(_internal())
+
+    async def ayield_keys(
+        self, *, prefix: Optional[str] = None, prefixes: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[str]:
         """
         Asynchronously yields keys matching a given prefix.
         It only yields the row keys that match the given prefix.
@@ -324,6 +394,9 @@ class BigtableByteStore(BaseStore[str, bytes]):
         Args:
            prefix: An optional prefix to filter keys by. If `None` or an empty
              string, all keys are yielded.
+           prefixes: An optional sequence of prefixes to filter keys by, in
+             addition to `prefix`. Keys matching any of them are yielded from a
+             single scan. An empty sequence without `prefix` matches no keys.
 
         Yields:
             Keys from the table that match a given prefix.
@@ -339,7 +412,7 @@ class BigtableByteStore(BaseStore[str, bytes]):
             # This coroutine runs on the BigtableEngine background loop.
             try:
                 store = await self._engine._run_as_async(self._get_async_store())
-                async for key in store.ayield_keys(prefix=prefix):
+                async for key in store.ayield_keys(prefix=prefix, prefixes=prefixes):
                     # The queue was created within the caller_loop(main running event loop) context
                     # Hence, its method is called within that loop
                     caller_loop.call_soon_threadsafe(q.put_nowait, key)
@@ -384,6 +457,49 @@ class BigtableByteStore(BaseStore[str, bytes]):
 
         return self._engine._run_as_sync(_internal())
 
+    def mget_numpy(self, keys: Sequence[str]) -> np.ndarray:
+        """
+        Synchronously retrieves values for a sequence of keys as a NumPy array.
+
+        Args:
+            keys: A sequence of keys to retrieve values for.
+
+        Returns:
+            A one-dimensional array of `object` dtype with the byte values
+            corresponding to the input keys. If a key is not found, `None` is
+            stored at that key's position in the array.
+        """
+
+        async def _internal():
+            store = await self._get_async_store()
+            return await store.amget_numpy(keys)
+
+        return self._engine._run_as_sync(_internal())
+
+    def mget_many(
+        self, batches: Sequence[Sequence[str]]
+    ) -> List[List[Optional[bytes]]]:
+        """
+        Synchronously retrieves values for several batches of keys at once.
+
+        All batches are read concurrently with a single hop to the engine's
+        background loop, which avoids the per-call synchronization cost of
+        issuing many small `mget` calls.
+
+        Args:
+            batches: A sequence of key sequences to retrieve values for.
+
+        Returns:
+            A list with one result list per batch, in the order of `batches`. Each
+            result list is the same as `mget` would return for that batch.
+        """
+
+        async def _internal():
+            store = await self._get_async_store()
+            return list(await asyncio.gather(*(store.amget(b) for b in batches)))
+
+        return self._engine._run_as_sync(_internal())
+
     def mset(self, key_value_pairs: Sequence[Tuple[str, bytes]]) -> None:
         """
         Synchronously stores key-value pairs in the Bigtable.
@@ -415,7 +531,34 @@ class BigtableByteStore(BaseStore[str, bytes]):
 
         self._engine._run_as_sync(_internal())
 
-    def yield_keys(self, *, prefix: Optional[str] = None) -> Iterator[str]:
+    def mupdate(
+        self,
+        key_value_pairs: Sequence[Tuple[str, bytes]],
+        delete_keys: Sequence[str],
+    ) -> None:
+        """
+        Synchronously deletes and stores key-value pairs in a single pass.
+
+        This is equivalent to calling `mdelete(delete_keys)` followed by
+        `mset(key_value_pairs)`, but all the mutations are sent together.
+
+        Args:
+            key_value_pairs: A sequence of (key, value) tuples to store.
+            delete_keys: A sequence of keys to delete.
+
+        Raises:
+            TypeError: If any key is not a string or any value is not bytes.
+        """
+
+        async def _internal():
+            store = await self._get_async_store()
+            return await store.amupdate(key_value_pairs, delete_keys)
+
+        self._engine._run_as_sync(_internal())
+
+    def yield_keys(
+        self, *, prefix: Optional[str] = None, prefixes: Optional[Sequence[str]] = None
+    ) -> Iterator[str]:
         """
         Synchronously yields keys matching a given prefix.
         It only yields the keys that match the given prefix.
@@ -423,6 +566,9 @@ class BigtableByteStore(BaseStore[str, bytes]):
         Args:
            prefix: An optional prefix to filter keys by. If `None` or an empty
              string, all keys are yielded.
+           prefixes: An optional sequence of prefixes to filter keys by, in
+             addition to `prefix`. Keys matching any of them are yielded from a
+             single scan. An empty sequence without `prefix` matches no keys.
 
         Yields:
             Keys from the table that match a given prefix.
@@ -441,7 +587,7 @@ class BigtableByteStore(BaseStore[str, bytes]):
         async def _producer(queue):
             try:
                 store = await self._get_async_store()
-                async for key in store.ayield_keys(prefix=prefix):
+                async for key in store.ayield_keys(prefix=prefix, prefixes=prefixes):
                     await queue.put(key)
             except Exception as e:
                 await queue.put(e)
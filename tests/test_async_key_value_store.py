@@ -30,7 +30,10 @@ from google.cloud.bigtable.data import (
     TableAsync,
 )
 
-from langchain_google_bigtable.async_key_value_store import AsyncBigtableByteStore
+from langchain_google_bigtable.async_key_value_store import (
+    AsyncBigtableByteStore,
+    _prefix_end_key,
+)
 
 TEST_COLUMN_FAMILY = "cf1"
 TEST_COLUMN = "test_col".encode("utf-8")
@@ -94,6 +97,13 @@ async def dynamic_table_id(
             raise e
 
 
+def test_prefix_end_key() -> None:
+    """Test the exclusive end key computed for a prefix scan."""
+    assert _prefix_end_key(b"abc") == b"abd"
+    assert _prefix_end_key(b"ab\xff") == b"ac"
+    assert _prefix_end_key(b"\xff\xff") is None
+
+
 class TestAsyncBigtableByteStore:
     """
     Integration tests for AsyncBigtableByteStore.
@@ -182,6 +192,56 @@ class TestAsyncBigtableByteStore:
         # Clean up
         await store.amdelete([test_key_1, test_key_2, test_key_3])
 
+    @pytest.mark.asyncio
+    async def test_ayield_keys_prefix_last_code_point(
+        self, store: AsyncBigtableByteStore
+    ) -> None:
+        """Test ayield_keys with a prefix ending in the last Unicode code point."""
+        prefix = TEST_ROW_PREFIX + "\U0010ffff"
+        test_key = prefix + uuid.uuid4().hex
+        await store.amset([(test_key, b"value")])
+        retrieved_keys = [key async for key in store.ayield_keys(prefix=prefix)]
+        assert retrieved_keys == [test_key]
+        await store.amdelete([test_key])
+
+    @pytest.mark.asyncio
+    async def test_ayield_keys_bytes(self, store: AsyncBigtableByteStore) -> None:
+        """Test ayield_keys_bytes yields the encoded keys matching a prefix."""
+        prefix = TEST_ROW_PREFIX + "bytes-" + uuid.uuid4().hex
+        test_keys = [prefix + "-1", prefix + "-2"]
+        await store.amset([(key, b"value") for key in test_keys])
+        retrieved_keys = [key async for key in store.ayield_keys_bytes(prefix=prefix)]
+        assert retrieved_keys == [key.encode("utf-8") for key in test_keys]
+        await store.amdelete(test_keys)
+
+    @pytest.mark.asyncio
+    async def test_ayield_keys_prefixes(self, store: AsyncBigtableByteStore) -> None:
+        """Test ayield_keys with several, overlapping prefixes."""
+        base = TEST_ROW_PREFIX + "multi-" + uuid.uuid4().hex
+        test_keys = [base + "/a/1", base + "/a/2", base + "/b/1", base + "/c/1"]
+        await store.amset([(key, b"value") for key in test_keys])
+
+        retrieved_keys = [
+            key
+            async for key in store.ayield_keys(
+                prefixes=[base + "/a/", base + "/a/1", base + "/c/"]
+            )
+        ]
+        assert retrieved_keys == [base + "/a/1", base + "/a/2", base + "/c/1"]
+
+        retrieved_keys = [
+            key
+            async for key in store.ayield_keys(
+                prefix=base + "/b/", prefixes=[base + "/a/2"]
+            )
+        ]
+        assert retrieved_keys == [base + "/a/2", base + "/b/1"]
+
+        # An explicitly empty list of prefixes matches no keys
+        assert [key async for key in store.ayield_keys(prefixes=[])] == []
+
+        await store.amdelete(test_keys)
+
     def test_yield_keys_sync_raises_error(self, store: AsyncBigtableByteStore) -> None:
         """Test yield_keys sync method raising NotImplementedError."""
         with pytest.raises(NotImplementedError):
@@ -194,6 +254,22 @@ class TestAsyncBigtableByteStore:
         retrieved_values = await store.amget([])
         assert retrieved_values == []
 
+    @pytest.mark.asyncio
+    async def test_amget_numpy(self, store: AsyncBigtableByteStore) -> None:
+        """Test amget_numpy returns the values in an object array."""
+        test_key_1 = TEST_ROW_PREFIX + uuid.uuid4().hex
+        test_key_2 = TEST_ROW_PREFIX + uuid.uuid4().hex
+        await store.amset([(test_key_1, b"value1"), (test_key_2, b"value2")])
+        retrieved_values = await store.amget_numpy(
+            [test_key_2, "missing-key", test_key_1, test_key_2]
+        )
+        assert retrieved_values.dtype == object
+        assert retrieved_values.tolist() == [b"value2", None, b"value1", b"value2"]
+        single_value = await store.amget_numpy([test_key_1])
+        assert single_value.tolist() == [b"value1"]
+        assert (await store.amget_numpy([])).shape == (0,)
+        await store.amdelete([test_key_1, test_key_2])
+
     @pytest.mark.asyncio
     async def test_amset_large_value(self, store: AsyncBigtableByteStore) -> None:
         """Test amset with a large value."""
@@ -217,6 +293,31 @@ class TestAsyncBigtableByteStore:
         for value in retrieved_values:
             assert value is not None
 
+    @pytest.mark.asyncio
+    async def test_amget_sharded_read(self, table: TableAsync) -> None:
+        """Test amget splits a large read into shards and keeps the key order."""
+        sharded_store = AsyncBigtableByteStore(
+            table,
+            column_family=TEST_COLUMN_FAMILY,
+            column_qualifier=TEST_COLUMN,
+            read_shards=4,
+        )
+        key_value_pairs = [
+            (TEST_ROW_PREFIX + f"shard-{i:05d}", os.urandom(10))
+            for i in range(4 * AsyncBigtableByteStore.MIN_KEYS_PER_READ_SHARD)
+        ]
+        await sharded_store.amset(key_value_pairs)
+        keys = [key for key, _ in reversed(key_value_pairs)] + ["missing-key"]
+        expected = [value for _, value in reversed(key_value_pairs)] + [None]
+        retrieved_values = await sharded_store.amget(keys)
+        assert retrieved_values == expected
+        await sharded_store.amdelete([key for key, _ in key_value_pairs])
+
+    def test_invalid_read_shards(self, table: TableAsync) -> None:
+        """Test that a non-positive read_shards raises ValueError."""
+        with pytest.raises(ValueError, match="read_shards must be at least 1."):
+            AsyncBigtableByteStore(table, read_shards=0)
+
     @pytest.mark.asyncio
     async def test_duplicate_key_amset(self, store: AsyncBigtableByteStore) -> None:
         """Test amset with duplicate keys."""
@@ -251,6 +352,20 @@ class TestAsyncBigtableByteStore:
         retrieved_value = await custom_store.amget([test_key])
         assert retrieved_value == [test_value]
 
+    @pytest.mark.asyncio
+    async def test_amget_row_without_value_column(
+        self, store: AsyncBigtableByteStore, table: TableAsync
+    ) -> None:
+        """Test amget returns None for a row that only has cells in another column."""
+        custom_store = AsyncBigtableByteStore(
+            table, column_family=CUSTOM_COLUMN_FAMILY, column_qualifier=CUSTOM_COLUMN
+        )
+        test_key = TEST_ROW_PREFIX + uuid.uuid4().hex
+        await custom_store.amset([(test_key, b"other-column-value")])
+        retrieved_value = await store.amget([test_key])
+        assert retrieved_value == [None]
+        await store.amdelete([test_key])
+
     @pytest.mark.asyncio
     async def test_invalid_key_type(self, store: AsyncBigtableByteStore) -> None:
         """Test that amset raises TypeError when a key is not a string."""
@@ -291,3 +406,206 @@ class TestAsyncBigtableByteStore:
         with pytest.raises(MutationsExceptionGroup) as exc_info:
             await store.amset([(test_key, test_value)])
         assert "Test MutationsExceptionGroup message" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_amset_splits_large_batches(
+        self, store: AsyncBigtableByteStore
+    ) -> None:
+        """Test that amset splits large inputs into bounded bulk_mutate_rows calls."""
+        batch_sizes = []
+
+        async def mock_bulk_mutate_rows(mutations):
+            batch_sizes.append(len(mutations))
+
+        store.table.bulk_mutate_rows = mock_bulk_mutate_rows
+        max_entries = AsyncBigtableByteStore.MAX_ENTRIES_PER_MUTATE_REQUEST
+        key_value_pairs = [
+            (TEST_ROW_PREFIX + str(i), b"value") for i in range(2 * max_entries + 1)
+        ]
+        await store.amset(key_value_pairs)
+        assert sorted(batch_sizes) == [1, max_entries, max_entries]
+
+    @pytest.mark.asyncio
+    async def test_negative_cache(self, table: TableAsync) -> None:
+        """Test that missing keys are served from the negative cache until written."""
+        cached_store = AsyncBigtableByteStore(
+            table,
+            column_family=TEST_COLUMN_FAMILY,
+            column_qualifier=TEST_COLUMN,
+            negative_cache_size=10,
+        )
+        test_key = TEST_ROW_PREFIX + uuid.uuid4().hex
+        assert await cached_store.amget([test_key]) == [None]
+
+        with mock.patch.object(table, "read_row", wraps=table.read_row) as read_row:
+            assert await cached_store.amget([test_key]) == [None]
+            read_row.assert_not_called()
+
+            await cached_store.amset([(test_key, b"value")])
+            assert await cached_store.amget([test_key]) == [b"value"]
+            read_row.assert_called_once()
+
+        await cached_store.amdelete([test_key])
+
+    @pytest.mark.asyncio
+    async def test_read_cache(self, table: TableAsync) -> None:
+        """Test that read values are served from the read cache until modified."""
+        cached_store = AsyncBigtableByteStore(
+            table,
+            column_family=TEST_COLUMN_FAMILY,
+            column_qualifier=TEST_COLUMN,
+            read_cache_max_bytes=1024,
+        )
+        test_key = TEST_ROW_PREFIX + uuid.uuid4().hex
+        await cached_store.amset([(test_key, b"value")])
+        assert await cached_store.amget([test_key]) == [b"value"]
+
+        with mock.patch.object(table, "read_row", wraps=table.read_row) as read_row:
+            assert await cached_store.amget([test_key]) == [b"value"]
+            read_row.assert_not_called()
+
+            await cached_store.amdelete([test_key])
+            assert await cached_store.amget([test_key]) == [None]
+            read_row.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_amset_combines_failed_batches(
+        self, store: AsyncBigtableByteStore
+    ) -> None:
+        """Test that failures from several batches are raised together with input indices."""
+
+        async def mock_bulk_mutate_rows(mutations):
+            # Fail the second entry of every batch
+            raise MutationsExceptionGroup(
+                [
+                    FailedMutationEntryError(
+                        failed_idx=1,
+                        failed_mutation_entry=mutations[1],
+                        cause=Exception("Dummy cause"),
+                    )
+                ],
+                len(mutations),
+            )
+
+        store.table.bulk_mutate_rows = mock_bulk_mutate_rows
+        max_entries = AsyncBigtableByteStore.MAX_ENTRIES_PER_MUTATE_REQUEST
+        key_value_pairs = [
+            (TEST_ROW_PREFIX + str(i), b"value") for i in range(2 * max_entries + 2)
+        ]
+
+        with pytest.raises(MutationsExceptionGroup) as exc_info:
+            await store.amset(key_value_pairs)
+
+        failures = exc_info.value.exceptions
+        assert [failure.index for failure in failures] == [
+            1,
+            max_entries + 1,
+            2 * max_entries + 1,
+        ]
+        for failure in failures:
+            assert failure.entry.row_key == key_value_pairs[failure.index][0].encode()
+        assert exc_info.value.total_entries_attempted == len(key_value_pairs)
+
+    @pytest.mark.asyncio
+    async def test_amdelete_reports_input_indices(
+        self, store: AsyncBigtableByteStore
+    ) -> None:
+        """Test that amdelete reports failed entries by their position in the input."""
+
+        async def mock_bulk_mutate_rows(mutations):
+            # Only the last batch fails
+            if len(mutations) == AsyncBigtableByteStore.MAX_ENTRIES_PER_MUTATE_REQUEST:
+                return
+            raise MutationsExceptionGroup(
+                [
+                    FailedMutationEntryError(
+                        failed_idx=0,
+                        failed_mutation_entry=mutations[0],
+                        cause=Exception("Dummy cause"),
+                    )
+                ],
+                len(mutations),
+            )
+
+        store.table.bulk_mutate_rows = mock_bulk_mutate_rows
+        max_entries = AsyncBigtableByteStore.MAX_ENTRIES_PER_MUTATE_REQUEST
+        keys = [TEST_ROW_PREFIX + str(i) for i in range(max_entries + 5)]
+
+        with pytest.raises(MutationsExceptionGroup) as exc_info:
+            await store.amdelete(keys)
+
+        failures = exc_info.value.exceptions
+        assert [failure.index for failure in failures] == [max_entries]
+        assert failures[0].entry.row_key == keys[max_entries].encode()
+
+    @pytest.mark.asyncio
+    async def test_caches_multiple_keys(self, table: TableAsync) -> None:
+        """Test that multi-key amget only reads the keys missing from the caches."""
+        cached_store = AsyncBigtableByteStore(
+            table,
+            column_family=TEST_COLUMN_FAMILY,
+            column_qualifier=TEST_COLUMN,
+            negative_cache_size=10,
+            read_cache_max_bytes=1024,
+        )
+        found_key = TEST_ROW_PREFIX + uuid.uuid4().hex
+        missing_key = TEST_ROW_PREFIX + uuid.uuid4().hex
+        new_key = TEST_ROW_PREFIX + uuid.uuid4().hex
+        await cached_store.amset([(found_key, b"found"), (new_key, b"new")])
+        assert await cached_store.amget([found_key, missing_key]) == [b"found", None]
+
+        with mock.patch.object(
+            table, "read_rows_stream", wraps=table.read_rows_stream
+        ) as read_rows_stream:
+            # Every key is in the read or negative cache
+            results = await cached_store.amget([found_key, missing_key, found_key])
+            assert results == [b"found", None, b"found"]
+            read_rows_stream.assert_not_called()
+
+            # Only the uncached key is sent to Bigtable
+            results = await cached_store.amget([found_key, new_key, missing_key])
+            assert results == [b"found", b"new", None]
+            read_rows_stream.assert_called_once()
+            query = read_rows_stream.call_args.args[0]
+            assert query.row_keys == [new_key.encode("utf-8")]
+
+        await cached_store.amdelete([found_key, new_key])
+
+    @pytest.mark.asyncio
+    async def test_cache_skips_reads_overlapping_writes(
+        self, table: TableAsync
+    ) -> None:
+        """Test that results of a multi-key read that overlaps a write are not cached."""
+        cached_store = AsyncBigtableByteStore(
+            table,
+            column_family=TEST_COLUMN_FAMILY,
+            column_qualifier=TEST_COLUMN,
+            negative_cache_size=10,
+            read_cache_max_bytes=1024,
+        )
+        found_key = TEST_ROW_PREFIX + uuid.uuid4().hex
+        missing_key = TEST_ROW_PREFIX + uuid.uuid4().hex
+        other_key = TEST_ROW_PREFIX + uuid.uuid4().hex
+        await cached_store.amset([(found_key, b"found")])
+
+        original_read_rows_stream = table.read_rows_stream
+
+        async def read_rows_stream_with_write(query):
+            # A write through the store lands while the read is in flight
+            await cached_store.amset([(other_key, b"other")])
+            return await original_read_rows_stream(query)
+
+        with mock.patch.object(
+            table, "read_rows_stream", side_effect=read_rows_stream_with_write
+        ):
+            results = await cached_store.amget([found_key, missing_key])
+            assert results == [b"found", None]
+
+        with mock.patch.object(
+            table, "read_rows_stream", wraps=table.read_rows_stream
+        ) as read_rows_stream:
+            results = await cached_store.amget([found_key, missing_key])
+            assert results == [b"found", None]
+            read_rows_stream.assert_called_once()
+
+        await cached_store.amdelete([found_key, other_key])
@@ -185,6 +185,21 @@ class TestBigtableByteStoreSync:
         sync_store.mdelete([])
         assert sync_store.mget(["key_empty_test"]) == [b"value"]
 
+    def test_sync_mget_many(self, sync_store: BigtableByteStore) -> None:
+        """Tests reading several batches of keys with a single call."""
+        sync_store.mset([("many1", b"m1"), ("many2", b"m2")])
+        results = sync_store.mget_many([["many1", "nonexistent"], [], ["many2"]])
+        assert results == [[b"m1", None], [], [b"m2"]]
+        sync_store.mdelete(["many1", "many2"])
+
+    def test_sync_mupdate(self, sync_store: BigtableByteStore) -> None:
+        """Tests deleting and setting keys with a single call."""
+        sync_store.mset([("upd1", b"old1"), ("upd2", b"old2")])
+        sync_store.mupdate([("upd2", b"new2"), ("upd3", b"new3")], ["upd1", "upd2"])
+        results = sync_store.mget(["upd1", "upd2", "upd3"])
+        assert results == [None, b"new2", b"new3"]
+        sync_store.mdelete(["upd2", "upd3"])
+
     def test_sync_yield_keys(self, sync_store: BigtableByteStore) -> None:
         """Tests yielding keys with and without a prefix."""
         # Clears table for this test.
@@ -206,6 +221,10 @@ class TestBigtableByteStoreSync:
         user_keys = sorted(list(sync_store.yield_keys(prefix="user/")))
         assert user_keys == ["user/1", "user/2"]
 
+        # Yield with several prefixes
+        multi_keys = list(sync_store.yield_keys(prefixes=["user/", "org/", "user/1"]))
+        assert multi_keys == ["org/1", "user/1", "user/2"]
+
         # Yield with a non-matching prefix
         assert list(sync_store.yield_keys(prefix="nonexistent/")) == []
 
@@ -296,6 +315,23 @@ class TestBigtableByteStoreAsync:
         await async_store.amdelete([])
         assert await async_store.amget(["akey_empty_test"]) == [b"value"]
 
+    async def test_async_amget_many(self, async_store: BigtableByteStore) -> None:
+        """Tests reading several batches of keys with a single async call."""
+        await async_store.amset([("amany1", b"m1"), ("amany2", b"m2")])
+        results = await async_store.amget_many([["amany1", "anonexistent"], ["amany2"]])
+        assert results == [[b"m1", None], [b"m2"]]
+        await async_store.amdelete(["amany1", "amany2"])
+
+    async def test_async_amupdate(self, async_store: BigtableByteStore) -> None:
+        """Tests deleting and setting keys with a single async call."""
+        await async_store.amset([("aupd1", b"old1"), ("aupd2", b"old2")])
+        await async_store.amupdate(
+            [("aupd2", b"new2"), ("aupd3", b"new3")], ["aupd1", "aupd2"]
+        )
+        results = await async_store.amget(["aupd1", "aupd2", "aupd3"])
+        assert results == [None, b"new2", b"new3"]
+        await async_store.amdelete(["aupd2", "aupd3"])
+
     async def test_async_ayield_keys(self, async_store: BigtableByteStore) -> None:
         """Tests ayield_keys with and without a prefix."""
         await async_store.amdelete(